@@ -7,16 +7,32 @@ A tool to automatically import Multiple Choice Questions into Anki from clipboar
 import re
 import time
 import json
-import urllib.request
-import urllib.error
+import http.client
+import urllib.parse
 import subprocess
 import sys
 import os
 import argparse
-from typing import Dict, List, Optional, Tuple
+import atexit
+from typing import Dict, List, Optional, Set, Tuple
 import hashlib
-from datetime import datetime
-from collections import deque
+from collections import OrderedDict
+
+# Optional native pasteboard access on macOS (pyobjc)
+try:
+    from AppKit import NSPasteboard, NSPasteboardTypeString
+except ImportError:
+    NSPasteboard = NSPasteboardTypeString = None
+
+# Optional faster JSON encoding for AnkiConnect requests
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
 
 # Version info
 __version__ = "1.0.0"
@@ -27,24 +43,102 @@ __license__ = "MIT"
 DEFAULT_CONFIG = {
     "deck_name": "AWS_SAP_02_IKKZ",
     "model_name": "IKKZ__MCQ.EN.NATIVE",
-    "check_interval": 1.0,  # seconds
+    "check_interval": 1.0,  # seconds, longest wait between checks when idle
+    "min_check_interval": 0.25,  # seconds, wait right after a clipboard change
     "max_cache_size": 100,  # maximum number of cached hashes
+    "cache_file": "~/.cache/anki_mcq_importer/seen.bin",  # processed hashes kept across runs ("" to disable)
+    "batch_size": 16,  # notes sent to Anki per request at most
+    "batch_delay": 1.0,  # seconds to wait for more notes before sending a batch
     "anki_url": "http://localhost:8765",
     "tags": ["auto-imported", "mcq"],
     "verbose": False
 }
 
+# Seconds between clipboard checks when the native pasteboard counter is used
+_NATIVE_POLL_INTERVAL = 0.1
+
+# Size in bytes of the content digests kept in the processed cache
+_DIGEST_SIZE = 8
+
+# Notes fetched per notesInfo call when preloading the deck's questions
+_NOTES_INFO_CHUNK = 500
+
+# Anki note fields, in model order; interned so every dict built from them
+# shares the same key objects
+MCQ_FIELDS = tuple(sys.intern(field) for field in (
+    'question', 'optionA', 'optionB', 'optionC', 'optionD', 'optionE', 'optionF',
+    'answer', 'note'
+))
+
+# MCQ field labels (without the trailing colon), matched case-insensitively
+_PLAIN_LABELS = ('question', 'answer', 'note')
+_OPTION_FIELDS = {
+    letter: field
+    for field in MCQ_FIELDS if field.startswith('option')
+    for letter in (field[-1], field[-1].lower())
+}
+
+# Bullet-point format section labels, matched in a single pass
+# ('• optionA:' and '• note:' are accepted as well)
+_BULLET_LABEL_RE = re.compile(
+    r'•\s*(question|options|option\s*([A-F])|answer|notes?)\s*:', re.IGNORECASE
+)
+# Bullet-point labels that mark the bullet format, matched the same way as
+# in _BULLET_LABEL_RE
+_BULLET_QUESTION_RE = re.compile(r'•\s*question\s*:', re.IGNORECASE)
+_BULLET_BODY_RE = re.compile(r'•\s*(?:options|answer)\s*:', re.IGNORECASE)
+# Option letters ('A.' to 'F.') at the start of the options block or after whitespace
+_BULLET_OPTION_SPLIT_RE = re.compile(r'(?:^|\s)([A-F])\.\s*')
+
+# Characters with a special meaning in Anki search terms
+_SEARCH_SPECIAL_RE = re.compile(r'([\\"*_])')
+
+def _escape_search(text: str) -> str:
+    """Escape text for use inside a quoted Anki search term"""
+    return _SEARCH_SPECIAL_RE.sub(r'\\\1', text)
+
 class ClipboardManager:
     """Cross-platform clipboard manager with memory optimization"""
     
     def __init__(self):
         self._last_content = ""
-        self._last_hash = ""
+        self._last_change_count = None
+        self._pasteboard = NSPasteboard.generalPasteboard() if NSPasteboard else None
+        
+    def change_count(self) -> Optional[int]:
+        """Get the pasteboard change counter, or None if unavailable"""
+        if self._pasteboard is None:
+            return None
+        return self._pasteboard.changeCount()
         
     def get_clipboard(self) -> str:
         """Get clipboard content with caching"""
-        if sys.platform == 'darwin':
-            try:
+        # Unchanged pasteboard: return the cached content without reading it
+        change_count = self.change_count()
+        if change_count is not None and change_count == self._last_change_count:
+            return self._last_content
+        
+        content = self._read_clipboard()
+        if content is not None:
+            # Keep the last good read to fall back on. An identical read hands
+            # back the cached object, so the monitor's change check
+            # short-circuits on identity; string equality checks the length
+            # before any characters
+            if content != self._last_content:
+                self._last_content = content
+            self._last_change_count = change_count
+            return self._last_content
+        
+        return self._last_content
+    
+    def _read_clipboard(self) -> Optional[str]:
+        """Read clipboard text, or None if it cannot be read"""
+        try:
+            # Native in-process read avoids forking pbpaste on every poll
+            if self._pasteboard is not None:
+                return self._pasteboard.stringForType_(NSPasteboardTypeString) or ""
+            
+            if sys.platform == 'darwin':
                 result = subprocess.run(
                     ['pbpaste'], 
                     capture_output=True, 
@@ -52,17 +146,12 @@ class ClipboardManager:
                     timeout=1
                 )
                 if result.returncode == 0:
-                    content = result.stdout
-                    # Cache to reduce subprocess calls
-                    if hashlib.md5(content.encode()).hexdigest() != self._last_hash:
-                        self._last_content = content
-                        self._last_hash = hashlib.md5(content.encode()).hexdigest()
-                    return content
-            except Exception as e:
-                if DEFAULT_CONFIG.get("verbose"):
-                    print(f"Clipboard error: {e}")
+                    return result.stdout
+        except Exception as e:
+            if DEFAULT_CONFIG.get("verbose"):
+                print(f"Clipboard error: {e}")
         
-        return self._last_content
+        return None
     
     def test_clipboard(self) -> bool:
         """Test clipboard functionality"""
@@ -76,10 +165,18 @@ class ClipboardManager:
             return False
 
 class AnkiConnector:
-    """AnkiConnect API interface with connection pooling"""
+    """AnkiConnect API interface"""
+    
+    _HEADERS = {'Content-Type': 'application/json'}
     
     def __init__(self, url: str = DEFAULT_CONFIG["anki_url"]):
         self.url = url
+        parts = urllib.parse.urlsplit(url)
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path or '/'
+        self._connection_class = (http.client.HTTPSConnection if parts.scheme == 'https'
+                                  else http.client.HTTPConnection)
         self._test_connection()
         
     def _test_connection(self):
@@ -93,28 +190,50 @@ class AnkiConnector:
         
     def invoke(self, action: str, **params) -> dict:
         """Send request to AnkiConnect"""
-        request_json = json.dumps({
+        request_json = _json_dumps({
             'action': action,
             'version': 6,
             'params': params
-        }).encode('utf-8')
-        
-        request = urllib.request.Request(self.url, request_json)
-        request.add_header('Content-Type', 'application/json')
+        })
         
         try:
-            with urllib.request.urlopen(request, timeout=5) as response:
-                response_data = json.loads(response.read().decode('utf-8'))
-                
-            if response_data['error'] is not None:
-                raise Exception(response_data['error'])
-                
-            return response_data['result']
-        except urllib.error.URLError as e:
+            # Both json and orjson parse UTF-8 bytes directly
+            response_data = _json_loads(self._post(request_json))
+        except (OSError, http.client.HTTPException) as e:
             raise Exception(f"Cannot connect to Anki. Ensure Anki is running and AnkiConnect is installed. Error: {e}")
+        
+        if response_data['error'] is not None:
+            raise Exception(response_data['error'])
+            
+        return response_data['result']
     
-    def create_note(self, deck_name: str, model_name: str, fields: dict, tags: List[str] = None) -> int:
-        """Create new note"""
+    def _post(self, body: bytes) -> bytes:
+        """Send one POST request and read the whole response"""
+        # AnkiConnect closes the socket after every response without a
+        # 'Connection: close' header, so a kept-open connection would only
+        # fail on the next request; each request uses a fresh one
+        conn = self._connection_class(self._host, self._port, timeout=5)
+        try:
+            conn.request('POST', self._path, body=body, headers=self._HEADERS)
+            response = conn.getresponse()
+            data = response.read()
+        finally:
+            conn.close()
+        
+        if response.status != 200:
+            raise http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+        return data
+    
+    def multi(self, actions: List[dict]) -> List[dict]:
+        """Send several actions in one request
+        
+        Each result is a dict with its own 'result' and 'error' keys.
+        """
+        return self.invoke('multi', actions=[{**action, 'version': 6} for action in actions])
+    
+    @staticmethod
+    def _build_note(deck_name: str, model_name: str, fields: dict, tags: List[str] = None) -> dict:
+        """Build an addNote payload"""
         note = {
             'deckName': deck_name,
             'modelName': model_name,
@@ -131,13 +250,34 @@ class AnkiConnector:
         
         if tags:
             note['tags'] = tags
-            
-        return self.invoke('addNote', note=note)
+        
+        return note
+    
+    def create_note(self, deck_name: str, model_name: str, fields: dict, tags: List[str] = None) -> int:
+        """Create new note"""
+        return self.invoke('addNote', note=self._build_note(deck_name, model_name, fields, tags))
+    
+    def create_notes(self, deck_name: str, model_name: str, fields_list: List[dict],
+                     tags: List[str] = None) -> List[dict]:
+        """Create several notes in one request, with a result/error per note"""
+        return self.multi([
+            {'action': 'addNote', 'params': {'note': self._build_note(deck_name, model_name, fields, tags)}}
+            for fields in fields_list
+        ])
     
     def find_notes(self, query: str) -> List[int]:
         """Find notes"""
         return self.invoke('findNotes', query=query)
     
+    def notes_info(self, note_ids: List[int]) -> List[dict]:
+        """Get fields of several notes"""
+        # One request per chunk, so a large deck cannot keep Anki busy past
+        # the connection timeout before it sends anything back
+        notes = []
+        for i in range(0, len(note_ids), _NOTES_INFO_CHUNK):
+            notes.extend(self.invoke('notesInfo', notes=note_ids[i:i + _NOTES_INFO_CHUNK]))
+        return notes
+    
     def get_decks(self) -> List[str]:
         """Get all decks"""
         return self.invoke('deckNames')
@@ -154,95 +294,210 @@ class AnkiConnector:
         """Get field names for a model"""
         return self.invoke('modelFieldNames', modelName=model_name)
 
+class MCQFields:
+    """Parsed MCQ, with one fixed slot per Anki field instead of a dict"""
+    
+    __slots__ = MCQ_FIELDS
+    
+    def __init__(self, question: str = '', optionA: str = '', optionB: str = '',
+                 optionC: str = '', optionD: str = '', optionE: str = '',
+                 optionF: str = '', answer: str = '', note: str = ''):
+        self.question = question
+        self.optionA = optionA
+        self.optionB = optionB
+        self.optionC = optionC
+        self.optionD = optionD
+        self.optionE = optionE
+        self.optionF = optionF
+        self.answer = answer
+        self.note = note
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Get the fields as a dict, for the AnkiConnect payload"""
+        return {field: getattr(self, field) for field in MCQ_FIELDS}
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MCQFields):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in MCQ_FIELDS)
+    
+    def __repr__(self) -> str:
+        set_fields = ', '.join(f'{field}={getattr(self, field)!r}'
+                               for field in MCQ_FIELDS if getattr(self, field))
+        return f'MCQFields({set_fields})'
+
 class TextParser:
     """Text parser for MCQ format"""
     
     @staticmethod
-    def parse_mcq_text(text: str) -> Optional[Dict[str, str]]:
+    def has_mcq_markers(text: str) -> bool:
+        """Cheap check for 'question:' and 'answer:' labels before a full parse"""
+        # Lower-case once and search literally; even with the copy, plain
+        # str.find is several times faster than a case-insensitive or
+        # character-class regex, or an Aho-Corasick automaton (pyahocorasick),
+        # on large clipboards
+        text = text.lower()
+        # The parser accepts the labels in any order, so neither is searched
+        # for relative to the other
+        return (TextParser._find_marker(text, 'question', 0) != -1
+                and TextParser._find_marker(text, 'answer', 0) != -1)
+    
+    @staticmethod
+    def _find_marker(text: str, label: str, start: int) -> int:
+        """Find 'label:' in lower-cased text, allowing whitespace before the colon
+        
+        Returns the index just past the colon, or -1 if not found.
+        """
+        pos = text.find(label, start)
+        while pos != -1:
+            end = pos + len(label)
+            while end < len(text) and text[end].isspace():
+                end += 1
+            if text.startswith(':', end):
+                return end + 1
+            pos = text.find(label, pos + 1)
+        return -1
+    
+    @staticmethod
+    def parse(text: str) -> Optional[MCQFields]:
+        """Parse MCQ text in either supported format"""
+        # Pick the parser by format; bullet-point text also contains
+        # 'question:' and 'answer:', which the structured parser would accept
+        # with the bullets and options folded into the question. Text the
+        # bullet parser rejects still gets a structured parse.
+        if TextParser.is_bullet_format(text):
+            parsed = TextParser.parse_alternative_format(text)
+            if parsed is not None:
+                return parsed
+        return TextParser.parse_mcq_text(text)
+    
+    @staticmethod
+    def parse_mcq_text(text: str) -> Optional[MCQFields]:
         """Parse MCQ formatted text"""
         # Clean text
         text = text.strip()
-        
-        # Check for required markers
-        if 'question:' not in text.lower() or 'answer:' not in text.lower():
+        spans: Dict[str, Tuple[int, int]] = {}
+        current, start = None, 0
+        
+        # Single pass over the colons in the text; each field runs until the
+        # next label of a field not yet seen, and the note is always the last
+        # field and takes the rest of the text. A 'Note:' before the answer
+        # is part of the question or an option, not the note label.
+        colon = text.find(':')
+        while colon != -1:
+            label = TextParser._label_ending_at(text, colon)
+            if (label is not None and label[0] != current and label[0] not in spans
+                    and (label[0] != 'note' or current == 'answer' or 'answer' in spans)):
+                field, label_start = label
+                if current is not None:
+                    spans[current] = (start, label_start)
+                current, start = field, colon + 1
+                if current == 'note':
+                    break
+            colon = text.find(':', colon + 1)
+        
+        if current is not None:
+            spans[current] = (start, len(text))
+        
+        # Validate required fields before extracting any values
+        if 'question' not in spans or 'answer' not in spans:
             return None
         
-        # Define parsing patterns
-        patterns = {
-            'question': r'question:\s*(.*?)(?=option[A-F]:|answer:|note:|$)',
-            'optionA': r'option\s*A:\s*(.*?)(?=option[B-F]:|answer:|note:|$)',
-            'optionB': r'option\s*B:\s*(.*?)(?=option[C-F]:|answer:|note:|$)',
-            'optionC': r'option\s*C:\s*(.*?)(?=option[D-F]:|answer:|note:|$)',
-            'optionD': r'option\s*D:\s*(.*?)(?=option[E-F]:|answer:|note:|$)',
-            'optionE': r'option\s*E:\s*(.*?)(?=option[F]:|answer:|note:|$)',
-            'optionF': r'option\s*F:\s*(.*?)(?=answer:|note:|$)',
-            'answer': r'answer:\s*(.*?)(?=note:|$)',
-            'note': r'note:\s*(.*?)(?=$)'
-        }
-        
-        result = {}
-        
-        for field, pattern in patterns.items():
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-            if match:
-                content = match.group(1).strip()
-                # Clean up extra whitespace
-                content = ' '.join(content.split())
-                result[field] = content
-        
-        # Validate required fields
-        required_fields = ['question', 'answer']
-        if all(field in result for field in required_fields):
-            return result
-        
+        # Clean up extra whitespace
+        parsed = MCQFields()
+        for field, (start, end) in spans.items():
+            setattr(parsed, field, ' '.join(text[start:end].split()))
+        return parsed
+    
+    @staticmethod
+    def _label_ending_at(text: str, colon: int) -> Optional[Tuple[str, int]]:
+        """Return (field, label start) if a field label ends at the colon"""
+        # Allow whitespace between the label and its colon
+        end = colon
+        while end > 0 and text[end - 1].isspace():
+            end -= 1
+        
+        for label in _PLAIN_LABELS:
+            label_start = end - len(label)
+            if label_start >= 0 and text[label_start:end].lower() == label:
+                return label, label_start
+        
+        # option[A-F], allowing whitespace before the letter
+        letter = end - 1
+        if letter < 0 or text[letter] not in _OPTION_FIELDS:
+            return None
+        end = letter
+        while end > 0 and text[end - 1].isspace():
+            end -= 1
+        label_start = end - len('option')
+        if label_start >= 0 and text[label_start:end].lower() == 'option':
+            return _OPTION_FIELDS[text[letter]], label_start
         return None
     
     @staticmethod
-    def parse_alternative_format(text: str) -> Optional[Dict[str, str]]:
+    def is_bullet_format(text: str) -> bool:
+        """Check for bullet-point question and options or answer labels, in any case"""
+        return ('•' in text and _BULLET_QUESTION_RE.search(text) is not None
+                and _BULLET_BODY_RE.search(text) is not None)
+    
+    @staticmethod
+    def parse_alternative_format(text: str) -> Optional[MCQFields]:
         """Parse alternative format with bullet points"""
         # For format like: • question: ... • options: A. ... B. ... • answer: ... • notes: ...
-        if '• question:' not in text:
+        if not TextParser.is_bullet_format(text):
             return None
             
-        patterns = {
-            'question': r'•\s*question:\s*(.*?)(?=•\s*options:|$)',
-            'options': r'•\s*options:\s*(.*?)(?=•\s*answer:|$)',
-            'answer': r'•\s*answer:\s*(.*?)(?=•\s*notes:|$)',
-            'notes': r'•\s*notes:\s*(.*?)(?=$)'
-        }
-        
         result = {}
+        current, start = None, 0
+        
+        # Each section runs until the next bullet label of a section not yet
+        # seen; notes is the last section and takes the rest of the text.
+        # Splitting at labels avoids lazy quantifiers and lookaheads.
+        for match in _BULLET_LABEL_RE.finditer(text):
+            field = match.group(1).lower()
+            if match.group(2):
+                field = _OPTION_FIELDS[match.group(2)]
+            elif field == 'note':
+                field = 'notes'
+            if field == current or field in result:
+                continue
+            if current is not None:
+                result[current] = text[start:match.start()].strip()
+            current, start = field, match.end()
+            if current == 'notes':
+                break
+        
+        if current is not None:
+            result[current] = text[start:].strip()
+        
+        # Validate required fields
+        if 'question' not in result or 'answer' not in result:
+            return None
         
-        for field, pattern in patterns.items():
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-            if match:
-                result[field] = match.group(1).strip()
+        # 'notes' maps to the 'note' field
+        parsed = MCQFields(result['question'], answer=result['answer'],
+                           note=result.get('notes', ''))
+        
+        # Options given one per bullet
+        for letter in 'ABCDEF':
+            field = _OPTION_FIELDS[letter]
+            if field in result:
+                setattr(parsed, field, ' '.join(result[field].split()))
         
         # Parse individual options from the options field
         if 'options' in result:
-            option_pattern = r'([A-F])\.\s*(.*?)(?=(?:[A-F]\.|$))'
-            matches = re.findall(option_pattern, result['options'], re.DOTALL)
-            
-            # Initialize all options as empty
-            for letter in 'ABCDEF':
-                result[f'option{letter}'] = ''
+            # Splitting keeps the captured letters: [prefix, 'A', text, 'B', text, ...]
+            parts = _BULLET_OPTION_SPLIT_RE.split(result['options'])
+            for i in range(1, len(parts) - 1, 2):
+                setattr(parsed, _OPTION_FIELDS[parts[i]], ' '.join(parts[i + 1].split()))
             
-            # Fill in found options
-            for letter, content in matches:
-                result[f'option{letter}'] = ' '.join(content.strip().split())
-            
-            # Remove the combined options field
-            del result['options']
-        
-        # Map 'notes' to 'note' for consistency
-        if 'notes' in result:
-            result['note'] = result.pop('notes')
-        
-        # Validate required fields
-        if 'question' in result and 'answer' in result:
-            return result
+            # Text before the first 'A.'-style letter (the whole block if the
+            # options use another form) stays in the question, not dropped
+            prefix = parts[0].strip()
+            if prefix:
+                parsed.question = f"{parsed.question}\n{prefix}"
         
-        return None
+        return parsed
 
 class AnkiMCQImporter:
     """Main importer class with memory optimization"""
@@ -252,121 +507,264 @@ class AnkiMCQImporter:
         self.anki = AnkiConnector(self.config["anki_url"])
         self.clipboard = ClipboardManager()
         
-        # Memory-efficient cache using deque
-        self.processed_hashes = deque(maxlen=self.config["max_cache_size"])
-        self.last_clipboard_hash = ""
+        # Memory-efficient LRU cache of content hashes (O(1) membership)
+        self.processed_hashes: "OrderedDict[bytes, None]" = OrderedDict()
+        self._load_hashes()
+        # Questions already in the target deck, so duplicates are skipped
+        # without a failed addNote round trip
+        self._deck_questions: Set[bytes] = set()
+        self.last_clipboard = ""
         self.import_count = 0
-        self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
+        
+        # Parsed notes waiting to be sent to Anki in one batch
+        self._pending: List[Tuple[bytes, MCQFields]] = []
+        self._pending_since = 0.0
+        
+        # Remember processed items for the next run
+        atexit.register(self._save_hashes)
         
         self._validate_setup()
         
     def _validate_setup(self):
         """Validate Anki setup"""
-        # Check if model exists
+        # Fetch models and decks in a single round trip
         try:
-            models = self.anki.get_model_names()
-            if self.config["model_name"] not in models:
-                print(f"⚠️  Warning: Model '{self.config['model_name']}' not found")
-                print(f"Available models: {', '.join(models[:5])}...")
-                
-                # Try to find MCQ model
-                mcq_models = [m for m in models if 'MCQ' in m.upper()]
-                if mcq_models:
-                    print(f"Found MCQ models: {', '.join(mcq_models)}")
-                    self.config["model_name"] = mcq_models[0]
-                    print(f"Using model: {self.config['model_name']}")
+            models_result, decks_result = self.anki.multi([
+                {'action': 'modelNames'},
+                {'action': 'deckNames'},
+            ])
         except Exception as e:
-            print(f"Error checking models: {e}")
+            print(f"Error checking Anki setup: {e}")
+            return
+        
+        # Check if model exists
+        if models_result['error'] is not None:
+            print(f"Error checking models: {models_result['error']}")
+        elif self.config["model_name"] not in models_result['result']:
+            models = models_result['result']
+            print(f"⚠️  Warning: Model '{self.config['model_name']}' not found")
+            print(f"Available models: {', '.join(models[:5])}...")
+            
+            # Try to find MCQ model
+            mcq_models = [m for m in models if 'MCQ' in m.upper()]
+            if mcq_models:
+                print(f"Found MCQ models: {', '.join(mcq_models)}")
+                self.config["model_name"] = mcq_models[0]
+                print(f"Using model: {self.config['model_name']}")
         
         # Ensure deck exists
-        self._ensure_deck_exists()
+        if decks_result['error'] is not None:
+            print(f"Error checking deck: {decks_result['error']}")
+        elif self._ensure_deck_exists(decks_result['result']):
+            self._load_deck_questions()
         
-    def _ensure_deck_exists(self):
-        """Ensure target deck exists"""
+    def _ensure_deck_exists(self, decks: List[str]) -> bool:
+        """Ensure target deck exists, returning whether it already did"""
         try:
-            decks = self.anki.get_decks()
             if self.config["deck_name"] not in decks:
                 self.anki.create_deck(self.config["deck_name"])
                 print(f"✓ Created deck: {self.config['deck_name']}")
+                return False
         except Exception as e:
             print(f"Error checking deck: {e}")
+            return False
+        return True
+    
+    def _load_deck_questions(self):
+        """Load hashes of the questions already in the target deck"""
+        # Same scope as the addNote duplicate check: this deck without its
+        # subdecks, and this note type only
+        deck = _escape_search(self.config["deck_name"])
+        model = _escape_search(self.config["model_name"])
+        try:
+            note_ids = self.anki.find_notes(f'deck:"{deck}" -deck:"{deck}::*" note:"{model}"')
+            notes = self.anki.notes_info(note_ids) if note_ids else []
+        except Exception as e:
+            print(f"Error loading deck questions: {e}")
+            return
+        
+        for note in notes:
+            question = note.get('fields', {}).get('question')
+            if question:
+                self._deck_questions.add(self._get_question_hash(question['value']))
+        
+        if self.config.get("verbose"):
+            print(f"✓ Loaded {len(self._deck_questions)} questions from deck")
+    
+    def _cache_path(self) -> Optional[str]:
+        """Get the processed-hash cache file path, if enabled"""
+        cache_file = self.config.get("cache_file")
+        return os.path.expanduser(cache_file) if cache_file else None
     
-    def _get_content_hash(self, content: str) -> str:
-        """Get hash of content"""
-        return hashlib.md5(content.encode()).hexdigest()
+    def _load_hashes(self):
+        """Load processed hashes saved by a previous run"""
+        path = self._cache_path()
+        if not path or not os.path.exists(path):
+            return
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"Error loading hash cache: {e}")
+            return
+        
+        # Fixed-size digests, oldest first; only the newest are kept
+        if len(data) % _DIGEST_SIZE == 0:
+            for i in range(0, len(data), _DIGEST_SIZE):
+                self._remember_hash(data[i:i + _DIGEST_SIZE])
+    
+    def _save_hashes(self):
+        """Save processed hashes for the next run"""
+        path = self._cache_path()
+        if not path:
+            return
+        # Queued notes were never imported, so they must not be remembered
+        pending = {content_hash for content_hash, _ in self._pending}
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(b''.join(h for h in self.processed_hashes if h not in pending))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error saving hash cache: {e}")
+    
+    def _get_content_hash(self, content: str) -> bytes:
+        """Get hash of content for the target deck and model (raw digest, used only as a cache key)"""
+        # Scoped like AnkiConnect's duplicate check, so the same text is still
+        # imported into another deck or note type
+        scope = f'{self.config["deck_name"]}\0{self.config["model_name"]}\0'
+        content_hash = hashlib.blake2b(scope.encode('utf-8'), digest_size=_DIGEST_SIZE)
+        content_hash.update(content.encode('utf-8'))
+        return content_hash.digest()
+    
+    @staticmethod
+    def _get_question_hash(question: str) -> bytes:
+        """Get hash of a question, ignoring differences in whitespace"""
+        normalized = ' '.join(question.split())
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=_DIGEST_SIZE).digest()
     
     def process_content(self, content: str) -> bool:
-        """Process clipboard content"""
-        # Check if already processed
+        """Process clipboard content, queueing it for import if it parses"""
+        # Record the hash up front, with a single lookup: if the size did not
+        # grow, it was already processed. It is dropped again if parsing or
+        # the import fails, so the content can be retried.
         content_hash = self._get_content_hash(content)
-        if content_hash in self.processed_hashes:
+        processed = self.processed_hashes
+        size = len(processed)
+        processed[content_hash] = None
+        if len(processed) == size:
+            processed.move_to_end(content_hash)
+            print(" Skipped: Already processed")
             return False
+        if size >= self.config["max_cache_size"]:
+            processed.popitem(last=False)
         
         if self.config.get("verbose"):
             print(f"\nDetected new content ({len(content)} chars)")
         
-        # Try parsing with both formats
-        parsed = TextParser.parse_mcq_text(content)
-        if not parsed:
-            parsed = TextParser.parse_alternative_format(content)
+        parsed = TextParser.parse(content)
         
-        if not parsed:
+        if parsed is None:
+            self._forget_hash(content_hash)
             if self.config.get("verbose"):
                 print("✗ Cannot parse content (invalid format)")
             return False
         
-        # Build fields for Anki
-        fields = {
-            'question': parsed.get('question', ''),
-            'optionA': parsed.get('optionA', ''),
-            'optionB': parsed.get('optionB', ''),
-            'optionC': parsed.get('optionC', ''),
-            'optionD': parsed.get('optionD', ''),
-            'optionE': parsed.get('optionE', ''),
-            'optionF': parsed.get('optionF', ''),
-            'answer': parsed.get('answer', ''),
-            'note': parsed.get('note', '')
-        }
-        
         # Display parsed result
-        print(f"\n Question: {fields['question'][:60]}...")
-        print(f"✓ Answer: {fields['answer']}")
+        print(f"\n Question: {parsed.question[:60]}...")
+        print(f"✓ Answer: {parsed.answer}")
         
+        question_hash = self._get_question_hash(parsed.question)
+        if question_hash in self._deck_questions:
+            print(" Skipped: Duplicate card")
+            return False
+        self._deck_questions.add(question_hash)
+        
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.append((content_hash, parsed))
+        
+        if len(self._pending) >= self.config["batch_size"]:
+            self.flush()
+        
+        return True
+    
+    def flush(self):
+        """Import queued notes now, with a single AnkiConnect request"""
+        if not self._pending:
+            return
+        
+        # The queue is only cleared once the request is done, so a batch
+        # interrupted mid-request (e.g. by Ctrl+C) is not saved as processed
+        pending = self._pending
         try:
-            # Create note
-            note_id = self.anki.create_note(
+            results = self.anki.create_notes(
                 deck_name=self.config["deck_name"],
                 model_name=self.config["model_name"],
-                fields=fields,
+                fields_list=[parsed.to_dict() for _, parsed in pending],
                 tags=self.config["tags"]
             )
-            
-            self.import_count += 1
-            print(f" Imported successfully (ID: {note_id}, Total: {self.import_count})")
-            
-            # Add to processed cache
-            self.processed_hashes.append(content_hash)
-            
-            return True
-            
         except Exception as e:
-            error_msg = str(e)
-            if "duplicate" in error_msg.lower():
+            self._pending = []
+            print(f" Import failed: {e}")
+            for content_hash, parsed in pending:
+                self._forget_content(content_hash, parsed)
+            return
+        self._pending = []
+        
+        for (content_hash, parsed), result in zip(pending, results):
+            if result.get('error') is None:
+                self.import_count += 1
+                print(f" Imported successfully (ID: {result['result']}, Total: {self.import_count})")
+            elif "duplicate" in str(result['error']).lower():
                 print(" Skipped: Duplicate card")
-                self.processed_hashes.append(content_hash)
             else:
-                print(f" Import failed: {error_msg}")
-            return False
+                print(f" Import failed: {result['error']}")
+                self._forget_content(content_hash, parsed)
+    
+    def _remember_hash(self, content_hash: bytes):
+        """Add a hash to the processed cache, evicting the least recently used"""
+        self.processed_hashes[content_hash] = None
+        if len(self.processed_hashes) > self.config["max_cache_size"]:
+            self.processed_hashes.popitem(last=False)
+    
+    def _forget_hash(self, content_hash: bytes):
+        """Drop a hash from the processed cache so the content can be retried"""
+        self.processed_hashes.pop(content_hash, None)
+    
+    def _forget_content(self, content_hash: bytes, parsed: MCQFields):
+        """Forget a note that failed to import so it can be retried"""
+        self._forget_hash(content_hash)
+        self._deck_questions.discard(self._get_question_hash(parsed.question))
     
     def start_monitoring(self):
         """Start clipboard monitoring"""
+        max_interval = self.config['check_interval']
+        min_interval = min(self.config['min_check_interval'], max_interval)
+        if self.clipboard.change_count() is not None:
+            # Unchanged ticks only read the pasteboard change counter, so a
+            # short fixed interval costs nothing and keeps imports snappy
+            sleep_times = [min(max_interval, _NATIVE_POLL_INTERVAL)] * 17
+        else:
+            # Sleep time per number of idle ticks, so the loop needs no arithmetic
+            sleep_times = [min(max_interval, min_interval * 2 ** ticks) for ticks in range(17)]
+        
+        if sleep_times[0] == sleep_times[-1]:
+            interval = f"{sleep_times[0]}s"
+        else:
+            interval = f"{sleep_times[0]}-{sleep_times[-1]}s"
+        
         print("\n" + "=" * 60)
         print(" Anki MCQ Auto Importer v" + __version__)
         print("=" * 60)
         print(f" Deck: {self.config['deck_name']}")
         print(f" Model: {self.config['model_name']}")
         print(f"  Tags: {', '.join(self.config['tags'])}")
-        print(f"  Check interval: {self.config['check_interval']}s")
+        print(f"  Check interval: {interval}")
         
         # Test clipboard
         self.clipboard.test_clipboard()
@@ -376,51 +774,68 @@ class AnkiMCQImporter:
         print(" Press Ctrl+C to stop")
         print("-" * 60)
         
-        check_count = 0
+        # Bind the names the loop itself uses to locals, which are cheaper to
+        # look up than attributes and globals
+        tick = self._tick
+        monotonic = time.monotonic
+        sleep = time.sleep
+        
+        idle_ticks = 0
+        next_status = monotonic() + 30
         
         try:
             while True:
                 try:
-                    # Get clipboard content
-                    current_content = self.clipboard.get_clipboard()
-                    
-                    if current_content:
-                        current_hash = self._get_content_hash(current_content)
-                        
-                        # Check if content changed
-                        if current_hash != self.last_clipboard_hash:
-                            self.last_clipboard_hash = current_hash
-                            
-                            # Check for MCQ markers
-                            if ('question:' in current_content.lower() and 
-                                'answer:' in current_content.lower()):
-                                self.process_content(current_content)
-                            elif self.config.get("verbose") and len(current_content) < 200:
-                                print(f"[{datetime.now().strftime('%H:%M:%S')}] Clipboard updated but not MCQ format")
+                    if tick():
+                        idle_ticks = 0
+                    else:
+                        idle_ticks = min(idle_ticks + 1, 16)
                     
-                    # Show status periodically
-                    check_count += 1
-                    if check_count % (30 / self.config['check_interval']) == 0:
-                        elapsed = (datetime.now() - self.start_time).seconds
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] Active for {elapsed//60}m {elapsed%60}s | Imported: {self.import_count}")
-                        
-                        # Memory cleanup every 5 minutes
-                        if elapsed % 300 == 0:
-                            import gc
-                            gc.collect()
+                    # Show status periodically; rescheduling from now (not
+                    # the missed slot) avoids a burst of lines after a stall
+                    now = monotonic()
+                    if now >= next_status:
+                        next_status = now + 30
+                        elapsed = int(now - self._start_monotonic)
+                        print(f"[{time.strftime('%H:%M:%S')}] Active for {elapsed//60}m {elapsed%60}s | Imported: {self.import_count}")
                     
                 except Exception as e:
                     print(f"Error processing clipboard: {e}")
                 
-                # Sleep
-                time.sleep(self.config['check_interval'])
+                # Poll quickly right after a change and back off while idle
+                sleep(sleep_times[idle_ticks])
                 
         except KeyboardInterrupt:
+            self.flush()
             self._show_summary()
     
+    def _tick(self) -> bool:
+        """Check the clipboard once; return True if its content changed"""
+        # Get clipboard content (cached while the pasteboard change counter
+        # has not moved)
+        current_content = self.clipboard.get_clipboard()
+        
+        # Check if content changed; a plain string comparison is far cheaper
+        # than encoding and hashing on every tick
+        changed = bool(current_content) and current_content != self.last_clipboard
+        if changed:
+            self.last_clipboard = current_content
+            
+            # Check for MCQ markers
+            if TextParser.has_mcq_markers(current_content):
+                self.process_content(current_content)
+            elif self.config.get("verbose") and len(current_content) < 200:
+                print(f"[{time.strftime('%H:%M:%S')}] Clipboard updated but not MCQ format")
+        
+        # Send queued notes once the batch has waited long enough
+        if self._pending and time.monotonic() - self._pending_since >= self.config["batch_delay"]:
+            self.flush()
+        
+        return changed
+    
     def _show_summary(self):
         """Show import summary"""
-        elapsed = (datetime.now() - self.start_time).seconds
+        elapsed = int(time.monotonic() - self._start_monotonic)
         print(f"\n\n{'=' * 60}")
         print(" Import Summary")
         print(f"{'=' * 60}")
@@ -468,7 +883,7 @@ Examples:
     parser.add_argument('--deck', help='Target deck name')
     parser.add_argument('--model', help='Card model name')
     parser.add_argument('--tags', nargs='+', help='Tags to add to cards')
-    parser.add_argument('--interval', type=float, help='Check interval in seconds')
+    parser.add_argument('--interval', type=float, help='Maximum check interval in seconds')
     parser.add_argument('--config', default='anki_mcq_config.json', help='Config file path')
     parser.add_argument('--save-config', action='store_true', help='Save current settings to config')
     parser.add_argument('--test', action='store_true', help='Test clipboard access')
@@ -0,0 +1,54 @@
+"""Shared fixtures: an importer wired to an in-memory AnkiConnect stub"""
+
+import pytest
+
+import anki_mcq_importer
+
+
+class FakeAnki:
+    """In-memory stand-in for AnkiConnector"""
+
+    def __init__(self, url=None):
+        self.decks = ['Default']
+        self.notes = {}
+        self.requests = []
+
+    def multi(self, actions):
+        results = {'modelNames': ['IKKZ__MCQ.EN.NATIVE'], 'deckNames': self.decks}
+        return [{'result': results[action['action']], 'error': None} for action in actions]
+
+    def create_deck(self, deck_name):
+        self.decks.append(deck_name)
+        return 1
+
+    def create_notes(self, deck_name, model_name, fields_list, tags=None):
+        self.requests.append(fields_list)
+        results = []
+        for fields in fields_list:
+            note_id = len(self.notes) + 1
+            self.notes[note_id] = fields
+            results.append({'result': note_id, 'error': None})
+        return results
+
+    def find_notes(self, query):
+        self.requests.append(query)
+        return list(self.notes)
+
+    def notes_info(self, note_ids):
+        return [{'noteId': i, 'fields': {k: {'value': v} for k, v in self.notes[i].items()}}
+                for i in note_ids]
+
+
+@pytest.fixture
+def make_importer(monkeypatch, tmp_path):
+    """Build importers that talk to a shared FakeAnki and cache under tmp_path"""
+    anki = FakeAnki()
+    monkeypatch.setattr(anki_mcq_importer, 'AnkiConnector', lambda url: anki)
+    monkeypatch.setattr(anki_mcq_importer.atexit, 'register', lambda func: None)
+
+    def make(**config):
+        config.setdefault('cache_file', str(tmp_path / 'seen.bin'))
+        return anki_mcq_importer.AnkiMCQImporter(config)
+
+    make.anki = anki
+    return make
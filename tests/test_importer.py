@@ -0,0 +1,85 @@
+"""Tests for the importer's processed cache and batching"""
+
+import os
+
+from anki_mcq_importer import _DIGEST_SIZE
+
+
+def mcq(n):
+    return f'question: Question {n}?\noptionA: x\nanswer: A'
+
+
+def test_cache_round_trip_keeps_newest(make_importer, tmp_path):
+    importer = make_importer(max_cache_size=2, batch_size=1)
+    for n in range(3):
+        assert importer.process_content(mcq(n))
+    importer._save_hashes()
+
+    assert os.path.getsize(tmp_path / 'seen.bin') == 2 * _DIGEST_SIZE
+    hashes = [importer._get_content_hash(mcq(n)) for n in range(3)]
+    reloaded = make_importer(max_cache_size=2)
+    assert list(reloaded.processed_hashes) == hashes[1:]
+
+
+def test_cache_hit_skips_content(make_importer):
+    importer = make_importer(batch_size=1)
+    assert importer.process_content(mcq(1))
+    assert not importer.process_content(mcq(1))
+    assert len(make_importer.anki.notes) == 1
+
+
+def test_cache_is_scoped_to_deck(make_importer):
+    importer = make_importer(batch_size=1)
+    assert importer.process_content(mcq(1))
+    importer._save_hashes()
+
+    other = make_importer(batch_size=1, deck_name='Other')
+    assert other.process_content(mcq(1))
+    assert len(make_importer.anki.notes) == 2
+
+
+def test_unparseable_content_is_not_cached(make_importer):
+    importer = make_importer()
+    assert not importer.process_content('question: no answer here')
+    assert not importer.processed_hashes
+
+
+def test_save_to_bare_filename(make_importer, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    importer = make_importer(cache_file='seen.bin', batch_size=1)
+    importer.process_content(mcq(1))
+    importer._save_hashes()
+    assert os.path.getsize(tmp_path / 'seen.bin') == _DIGEST_SIZE
+
+
+def test_pending_batch_is_not_saved_until_flushed(make_importer, tmp_path):
+    importer = make_importer(batch_size=16)
+    importer.process_content(mcq(1))
+    importer.process_content(mcq(2))
+    importer._save_hashes()
+    assert os.path.getsize(tmp_path / 'seen.bin') == 0
+
+    importer.flush()
+    importer._save_hashes()
+    assert os.path.getsize(tmp_path / 'seen.bin') == 2 * _DIGEST_SIZE
+    assert make_importer.anki.requests == [[
+        {'question': 'Question 1?', 'optionA': 'x', 'optionB': '', 'optionC': '', 'optionD': '',
+         'optionE': '', 'optionF': '', 'answer': 'A', 'note': ''},
+        {'question': 'Question 2?', 'optionA': 'x', 'optionB': '', 'optionC': '', 'optionD': '',
+         'optionE': '', 'optionF': '', 'answer': 'A', 'note': ''},
+    ]]
+
+
+def test_deck_questions_query_matches_duplicate_scope(make_importer):
+    make_importer.anki.decks.append('AWS_SAP "02"')
+    make_importer(deck_name='AWS_SAP "02"', model_name='IKKZ__MCQ.EN.NATIVE')
+    assert make_importer.anki.requests == [
+        r'deck:"AWS\_SAP \"02\"" -deck:"AWS\_SAP \"02\"::*" note:"IKKZ\_\_MCQ.EN.NATIVE"'
+    ]
+
+
+def test_deck_questions_are_skipped(make_importer):
+    make_importer.anki.notes[1] = {'question': 'Question  1?', 'answer': 'A'}
+    importer = make_importer(deck_name='Default')
+    assert not importer.process_content(mcq(1))
+    assert importer.process_content(mcq(2))
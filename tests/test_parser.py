@@ -0,0 +1,180 @@
+"""Tests for the MCQ text parsers"""
+
+import os
+
+import pytest
+
+from anki_mcq_importer import MCQFields, TextParser
+
+SAMPLES_FILE = os.path.join(os.path.dirname(__file__), '..', 'examples', 'sample_questions.txt')
+
+
+def load_samples():
+    """Get the example questions, one string per question"""
+    with open(SAMPLES_FILE, encoding='utf-8') as f:
+        return f.read().split('\n---\n')
+
+
+@pytest.mark.parametrize('index, answer, option_a', [
+    (0, 'C', 't3.micro'),
+    (2, 'A', '5 GB'),
+])
+def test_structured_samples(index, answer, option_a):
+    parsed = TextParser.parse_mcq_text(load_samples()[index])
+    assert parsed is not None
+    assert parsed.question.endswith('?')
+    assert parsed.answer == answer
+    assert parsed.optionA == option_a
+    assert parsed.optionF
+    assert parsed.note
+
+
+@pytest.mark.parametrize('index, answer, option_a', [
+    (1, 'B', 'Amazon RDS'),
+    (3, 'A', 'AWS Identity and Access Management (IAM)'),
+])
+def test_bullet_samples(index, answer, option_a):
+    parsed = TextParser.parse_alternative_format(load_samples()[index])
+    assert parsed is not None
+    assert parsed.question.endswith('?')
+    assert parsed.answer == answer
+    assert parsed.optionA == option_a
+    assert parsed.optionF
+    assert parsed.note
+
+
+def test_structured_fields():
+    parsed = TextParser.parse_mcq_text(
+        'question: Pick one\noptionA: x\noptionB: y\nanswer: B\nnote: because'
+    )
+    assert parsed == MCQFields(question='Pick one', optionA='x', optionB='y',
+                               answer='B', note='because')
+
+
+def test_structured_requires_question_and_answer():
+    assert TextParser.parse_mcq_text('question: Pick one\noptionA: x') is None
+    assert TextParser.parse_mcq_text('optionA: x\nanswer: A') is None
+    assert TextParser.parse_mcq_text('nothing to see here') is None
+
+
+def test_structured_spaced_option_label():
+    parsed = TextParser.parse_mcq_text('question: Pick one\nOption A: x\nanswer: A')
+    assert parsed.question == 'Pick one'
+    assert parsed.optionA == 'x'
+
+
+def test_structured_whitespace_before_colon():
+    parsed = TextParser.parse_mcq_text('Question : Pick one\noptionA : x\nAnswer : B')
+    assert parsed.question == 'Pick one'
+    assert parsed.optionA == 'x'
+    assert parsed.answer == 'B'
+
+
+def test_structured_fields_in_any_order():
+    parsed = TextParser.parse_mcq_text('answer: B\nquestion: Pick one\noptionB: y')
+    assert parsed.question == 'Pick one'
+    assert parsed.optionB == 'y'
+    assert parsed.answer == 'B'
+
+
+def test_structured_repeated_label_stays_in_value():
+    parsed = TextParser.parse_mcq_text('question: Pick one\nanswer: B\nanswer: C')
+    assert parsed.answer == 'B answer: C'
+
+
+def test_structured_note_takes_rest_of_text():
+    parsed = TextParser.parse_mcq_text('question: Pick one\nanswer: B\nnote: see optionA: x')
+    assert parsed.optionA == ''
+    assert parsed.note == 'see optionA: x'
+
+
+def test_structured_collapses_whitespace():
+    parsed = TextParser.parse_mcq_text('question:  Pick\n  one \nanswer:\tB ')
+    assert parsed.question == 'Pick one'
+    assert parsed.answer == 'B'
+
+
+def test_bullet_option_split_ignores_letter_inside_word():
+    parsed = TextParser.parse_alternative_format(
+        '• question: Pick one\n• options:\nA. Amazon RDS for DB. B. Aurora\n• answer: B'
+    )
+    assert parsed.optionA == 'Amazon RDS for DB.'
+    assert parsed.optionB == 'Aurora'
+
+
+def test_bullet_section_ends_at_next_label():
+    parsed = TextParser.parse_alternative_format('• question: Pick one\n• answer: B\n• notes: because')
+    assert parsed.question == 'Pick one'
+    assert parsed.answer == 'B'
+    assert parsed.note == 'because'
+
+
+def test_bullet_requires_question_and_answer():
+    assert TextParser.parse_alternative_format('• question: Pick one\n• notes: because') is None
+    assert TextParser.parse_alternative_format('question: Pick one\nanswer: B') is None
+
+
+def test_has_mcq_markers():
+    assert TextParser.has_mcq_markers('Question : Pick one\nANSWER: B')
+    assert TextParser.has_mcq_markers('Answer: B\nQuestion: Pick one')
+    assert not TextParser.has_mcq_markers('question: Pick one\noptionA: x')
+    assert not TextParser.has_mcq_markers('just some copied text')
+
+
+def test_structured_note_before_answer_stays_in_value():
+    parsed = TextParser.parse_mcq_text(
+        'question: Pick one. Note: must be cost-effective\n'
+        'optionA: x\noptionB: y\nanswer: B\nnote: because'
+    )
+    assert parsed.question == 'Pick one. Note: must be cost-effective'
+    assert parsed.optionB == 'y'
+    assert parsed.answer == 'B'
+    assert parsed.note == 'because'
+
+
+def test_bullet_labels_ignore_case_and_whitespace():
+    parsed = TextParser.parse_alternative_format(
+        '• Question : Pick one\n• Options:\nA. x\nB. y\n• ANSWER: B'
+    )
+    assert parsed.question == 'Pick one'
+    assert parsed.optionB == 'y'
+    assert parsed.answer == 'B'
+
+
+@pytest.mark.parametrize('text', [
+    '• question: Pick one\n• options:\nA. x\nB. y\n• answer: B',
+    '• Question: Pick one\n• Options:\nA. x\nB. y\n• Answer: B',
+    '• question : Pick one\n• options :\nA. x\nB. y\n• answer : B',
+])
+def test_parse_picks_bullet_parser(text):
+    parsed = TextParser.parse(text)
+    assert parsed.question == 'Pick one'
+    assert parsed.optionA == 'x'
+    assert parsed.answer == 'B'
+
+
+def test_parse_all_samples():
+    for sample in load_samples():
+        parsed = TextParser.parse(sample)
+        assert parsed is not None
+        assert parsed.question.endswith('?')
+        assert '•' not in parsed.question
+
+
+def test_parse_bullet_question_with_plain_answer():
+    parsed = TextParser.parse('• question: foo?\nanswer: B')
+    assert parsed.question == 'foo?'
+    assert parsed.answer == 'B'
+
+
+def test_parse_bullet_option_labels():
+    parsed = TextParser.parse('• question: q?\n• optionA: x\n• optionB: y\n• answer: B\n• note: n')
+    assert parsed == MCQFields(question='q?', optionA='x', optionB='y', answer='B', note='n')
+
+
+@pytest.mark.parametrize('options', ['(A) x (B) y', '1. x\n2. y'])
+def test_bullet_unsplit_options_stay_in_question(options):
+    parsed = TextParser.parse(f'• question: Pick one\n• options: {options}\n• answer: B')
+    assert parsed.question == f'Pick one\n{options}'
+    assert parsed.optionA == ''
+    assert parsed.answer == 'B'